@@ -1,4 +1,5 @@
-from optimization_methods import int_dalijimo_pusiau_metodas, auksinio_pjuvio_metodas, niutono_metodas
+from optimization_methods import minimize_scalar, OptimizeResult
+from trace_store import TraceReader
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -87,6 +88,141 @@ def create_objective_function(a: float, b: float):
     return f, df, d2f
 
 
+# 3. Rezultatų spausdinimas
+
+def print_result(res: OptimizeResult, func_calls_note: str = ''):
+    """spausdina vieno metodo rezultatą (arba klaidos pranešimą, jei metodas nepavyko)"""
+    if res.status == 2:
+        print(f"Metodas nepavyko: {res.message}")
+        return
+    print(f"Rastas minimumas: x* = {res.x_min:.6f}")
+    print(f"Funkcijos reikšmė: f(x*) = {res.f_min:.6f}")
+    print(f"Iteracijų skaičius: {res.iterations}")
+    print(f"Funkcijų skaičiavimų skaičius: {res.func_calls} {func_calls_note}".rstrip())
+    if not res.success:
+        print(f"Pastaba: {res.message}")
+
+
+# 4. Vizualizacija
+
+def plot_results(
+    f, l, r, points_bis, points_gold, points_newton, min_bis, min_gold, min_newton,
+    output_prefix: str = 'vizualizacija'
+) -> tuple:
+    """
+    nubraižo tikslo funkciją, metodų bandymo taškus ir rastus minimumus.
+
+    parametrai:
+        f: tikslo funkcija (turi priimti numpy masyvus)
+        l, r: intervalas
+        points_bis, points_gold, points_newton: bandymo taškai (sąrašai arba masyvai)
+        min_bis, min_gold, min_newton: rasti minimumai (x_min, f_min)
+        output_prefix: failų kelio pradžia; įrašomi <prefix>.png ir <prefix>_arti.png
+
+    grąžina:
+        (bendro vaizdo failas, priartinto vaizdo failas)
+    """
+    points_bis = np.asarray(points_bis, dtype=float)
+    points_gold = np.asarray(points_gold, dtype=float)
+    points_newton = np.asarray(points_newton, dtype=float)
+    (x_min_bis, f_min_bis), (x_min_gold, f_min_gold), (x_min_newton, f_min_newton) = min_bis, min_gold, min_newton
+
+    # funkcijos grafikas
+    xs = np.linspace(l, r, 1000)
+    ys = f(xs)
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(xs, ys, 'b-', linewidth=2, label='f(x)')
+
+    # bandymo taškai
+    plt.scatter(points_bis, f(points_bis), s=15, alpha=0.6, label='Dalijimas pusiau')
+    plt.scatter(points_gold, f(points_gold), s=15, alpha=0.6, label='Auksinis pjūvis')
+    plt.scatter(points_newton, f(points_newton), s=25, alpha=0.8, label='Niutono metodas')
+
+    # rasti minimumai
+    plt.scatter([x_min_bis], [f_min_bis], c='red', s=60, marker='x', label='Minimumas (dalijimas pusiau)')
+    plt.scatter([x_min_gold], [f_min_gold], c='green', s=60, marker='x', label='Minimumas (auksinis pjūvis)')
+    plt.scatter([x_min_newton], [f_min_newton], c='purple', s=60, marker='x', label='Minimumas (Niutono metodas)')
+
+    plt.title('Tikslo funkcija ir bandymo taškai')
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=9)
+    plt.tight_layout()
+    full_path = output_prefix + '.png'
+    plt.savefig(full_path, dpi=150)
+    plt.close()
+
+    # priartintas vaizdas aplink minimumą
+    min_x = x_min_newton
+    zoom_half_width = 0.2  # priartinamas plotis apie minimumą
+    zx_min = max(l, min_x - zoom_half_width)
+    zx_max = min(r, min_x + zoom_half_width)
+
+    zxs = np.linspace(zx_min, zx_max, 600)
+    zys = f(zxs)
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(zxs, zys, 'b-', linewidth=2, label='f(x)')
+    for points, size, alpha, label in (
+        (points_bis, 15, 0.6, 'Dalijimas pusiau'),
+        (points_gold, 15, 0.6, 'Auksinis pjūvis'),
+        (points_newton, 25, 0.8, 'Niutono metodas'),
+    ):
+        in_zoom = points[(points >= zx_min) & (points <= zx_max)]
+        plt.scatter(in_zoom, f(in_zoom), s=size, alpha=alpha, label=label)
+
+    plt.scatter([x_min_bis], [f_min_bis], c='red', s=60, marker='x', label='Minimumas (dalijimas pusiau)')
+    plt.scatter([x_min_gold], [f_min_gold], c='green', s=60, marker='x', label='Minimumas (auksinis pjūvis)')
+    plt.scatter([x_min_newton], [f_min_newton], c='purple', s=60, marker='x', label='Minimumas (Niutono metodas)')
+
+    # dinamiškai nustatyti y-ašies ribas - rasti min ir max funkcijos reikšmes priartintame intervale
+    zy_min_val = zys.min()
+    zy_max_val = zys.max()
+    zy_margin = (zy_max_val - zy_min_val) * 0.05  # 5% marža
+
+    plt.xlim(zx_min, zx_max)
+    plt.ylim(zy_min_val - zy_margin, zy_max_val + zy_margin)
+    plt.title('Priartintas vaizdas aplink minimumą')
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=9)
+    plt.tight_layout()
+    zoom_path = output_prefix + '_arti.png'
+    plt.savefig(zoom_path, dpi=150)
+    plt.close()
+
+    return full_path, zoom_path
+
+
+def plot_from_trace(
+    f, trace_path: str, solve_bis: int, solve_gold: int, solve_newton: int,
+    l: float = 0, r: float = 10, output_prefix: str = 'vizualizacija'
+) -> tuple:
+    """
+    nubraižo vizualizaciją tiesiai iš TraceWriter įrašyto failo (be istorijų atkūrimo į žodynus).
+
+    parametrai:
+        f: tikslo funkcija
+        trace_path: trasos failo kelias (.npy)
+        solve_bis, solve_gold, solve_newton: kiekvieno metodo sprendimo numeriai faile
+        l, r: intervalas
+        output_prefix: failų kelio pradžia (žr. plot_results)
+
+    grąžina:
+        (bendro vaizdo failas, priartinto vaizdo failas)
+    """
+    reader = TraceReader(trace_path)
+    return plot_results(
+        f, l, r,
+        reader.trial_points(solve_bis), reader.trial_points(solve_gold), reader.trial_points(solve_newton),
+        reader.result(solve_bis)[:2], reader.result(solve_gold)[:2], reader.result(solve_newton)[:2],
+        output_prefix
+    )
+
+
 def main():
   
     print("="*70)
@@ -145,35 +281,24 @@ def main():
     print(f"\n{'-'*70}")
     print("3.1. INTERVALO DALIJIMO PUSIAU METODAS")
     print(f"{'-'*70}")
-    x_min_bis, f_min_bis, iter_bis, f_evals_bis, history_bis = int_dalijimo_pusiau_metodas(f, l, r, epsilon)
-    print(f"Rastas minimumas: x* = {x_min_bis:.6f}")
-    print(f"Funkcijos reikšmė: f(x*) = {f_min_bis:.6f}")
-    print(f"Iteracijų skaičius: {iter_bis}")
-    print(f"Funkcijų skaičiavimų skaičius: {f_evals_bis}")
+    res_bis = minimize_scalar(f, bracket=(l, r), method='pusiau', epsilon=epsilon)
+    print_result(res_bis)
     
     # 3.2 auksinio pjūvio metodas
     print(f"\n{'-'*70}")
     print("3.2. AUKSINIO PJŪVIO METODAS")
     print(f"{'-'*70}")
-    x_min_gold, f_min_gold, iter_gold, f_evals_gold, history_gold = auksinio_pjuvio_metodas(f, l, r, epsilon)
-    print(f"Rastas minimumas: x* = {x_min_gold:.6f}")
-    print(f"Funkcijos reikšmė: f(x*) = {f_min_gold:.6f}")
-    print(f"Iteracijų skaičius: {iter_gold}")
-    print(f"Funkcijų skaičiavimų skaičius: {f_evals_gold}")
+    res_gold = minimize_scalar(f, bracket=(l, r), method='auksinis', epsilon=epsilon)
+    print_result(res_gold)
     
     # 3.3 niutono metodas
     print(f"\n{'-'*70}")
     print("3.3. NIUTONO METODAS")
     print(f"{'-'*70}")
-    x_min_newton, f_min_newton, iter_newton, f_evals_newton, history_newton = niutono_metodas(
-        f, df, d2f, x0, epsilon
-    )
-    print(f"Rastas minimumas: x* = {x_min_newton:.6f}")
-    print(f"Funkcijos reikšmė: f(x*) = {f_min_newton:.6f}")
-    print(f"Iteracijų skaičius: {iter_newton}")
-    print(f"Funkcijų skaičiavimų skaičius: {f_evals_newton} (f'(x) ir f''(x) + f(x) galutinei reikšmei)")
-    if history_newton:
-        last_step = history_newton[-1].get('step')
+    res_newton = minimize_scalar(f, x0=x0, df=df, d2f=d2f, method='niutono', epsilon=epsilon)
+    print_result(res_newton, "(f'(x) ir f''(x) + f(x) galutinei reikšmei)")
+    if res_newton.history:
+        last_step = res_newton.history[-1].get('step')
         if last_step is not None:
             print(f"Paskutinio žingsnio ilgis: {last_step:.6e}")
     
@@ -183,9 +308,8 @@ def main():
     print(f"{'='*70}")
     print(f"{'Metodas':<30} {'x*':<12} {'f(x*)':<12} {'Žingsniai':<12} {'f skaič.':<12}")
     print(f"{'-'*70}")
-    print(f"{'Dalijimas pusiau':<30} {x_min_bis:<12.6f} {f_min_bis:<12.6f} {iter_bis:<12} {f_evals_bis:<12}")
-    print(f"{'Auksinis pjūvis':<30} {x_min_gold:<12.6f} {f_min_gold:<12.6f} {iter_gold:<12} {f_evals_gold:<12}")
-    print(f"{'Niutono metodas':<30} {x_min_newton:<12.6f} {f_min_newton:<12.6f} {iter_newton:<12} {f_evals_newton:<12}")
+    for name, res in (('Dalijimas pusiau', res_bis), ('Auksinis pjūvis', res_gold), ('Niutono metodas', res_newton)):
+        print(f"{name:<30} {res.x_min:<12.6f} {res.f_min:<12.6f} {res.iterations:<12} {res.func_calls:<12}")
     
     # 4. vizualizacija
     print(f"\n{'='*70}")
@@ -194,85 +318,23 @@ def main():
 
     # surenkame bandymo taškus
     points_bis = []
-    for h in history_bis:
+    for h in res_bis.history:
         points_bis.extend([h['l'], h['x_1'], h['x_m'], h['x_2'], h['r']])
 
     points_gold = []
-    for h in history_gold:
+    for h in res_gold.history:
         points_gold.extend([h['l'], h['x_1'], h['x_2'], h['r']])
 
-    points_newton = [h['x_i'] for h in history_newton]
-    for h in history_newton:
+    points_newton = [h['x_i'] for h in res_newton.history]
+    for h in res_newton.history:
         if 'x_next' in h:
             points_newton.append(h['x_next'])
 
-    # funkcijos grafikas
-    xs = np.linspace(l, r, 1000)
-    ys = [f(x) for x in xs]
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(xs, ys, 'b-', linewidth=2, label='f(x)')
-
-    # bandymo taškai
-    plt.scatter(points_bis, [f(x) for x in points_bis], s=15, alpha=0.6, label='Dalijimas pusiau')
-    plt.scatter(points_gold, [f(x) for x in points_gold], s=15, alpha=0.6, label='Auksinis pjūvis')
-    plt.scatter(points_newton, [f(x) for x in points_newton], s=25, alpha=0.8, label='Niutono metodas')
-
-    # rasti minimumai
-    plt.scatter([x_min_bis], [f_min_bis], c='red', s=60, marker='x', label='Minimumas (dalijimas pusiau)')
-    plt.scatter([x_min_gold], [f_min_gold], c='green', s=60, marker='x', label='Minimumas (auksinis pjūvis)')
-    plt.scatter([x_min_newton], [f_min_newton], c='purple', s=60, marker='x', label='Minimumas (Niutono metodas)')
-
-    plt.title('Tikslo funkcija ir bandymo taškai')
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=9)
-    plt.tight_layout()
-    plt.savefig('vizualizacija.png', dpi=150)
-    plt.close()
-
-    # priartintas vaizdas aplink minimumą
-    min_x = x_min_newton
-    zoom_half_width = 0.2  # priartinamas plotis apie minimumą
-    zx_min = max(l, min_x - zoom_half_width)
-    zx_max = min(r, min_x + zoom_half_width)
-
-    zxs = np.linspace(zx_min, zx_max, 600)
-    zys = [f(x) for x in zxs]
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(zxs, zys, 'b-', linewidth=2, label='f(x)')
-    plt.scatter([x for x in points_bis if zx_min <= x <= zx_max],
-                [f(x) for x in points_bis if zx_min <= x <= zx_max],
-                s=15, alpha=0.6, label='Dalijimas pusiau')
-    plt.scatter([x for x in points_gold if zx_min <= x <= zx_max],
-                [f(x) for x in points_gold if zx_min <= x <= zx_max],
-                s=15, alpha=0.6, label='Auksinis pjūvis')
-    plt.scatter([x for x in points_newton if zx_min <= x <= zx_max],
-                [f(x) for x in points_newton if zx_min <= x <= zx_max],
-                s=25, alpha=0.8, label='Niutono metodas')
-
-    plt.scatter([x_min_bis], [f_min_bis], c='red', s=60, marker='x', label='Minimumas (dalijimas pusiau)')
-    plt.scatter([x_min_gold], [f_min_gold], c='green', s=60, marker='x', label='Minimumas (auksinis pjūvis)')
-    plt.scatter([x_min_newton], [f_min_newton], c='purple', s=60, marker='x', label='Minimumas (Niutono metodas)')
-
-    # dinamiškai nustatyti y-ašies ribas - rasti min ir max funkcijos reikšmes priartintame intervale
-    zy_values = zys  # funkcijos reikšmės priartintame intervale
-    zy_min_val = min(zy_values)
-    zy_max_val = max(zy_values)
-    zy_margin = (zy_max_val - zy_min_val) * 0.05  # 5% marža
-    
-    plt.xlim(zx_min, zx_max)
-    plt.ylim(zy_min_val - zy_margin, zy_max_val + zy_margin)
-    plt.title('Priartintas vaizdas aplink minimumą')
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=9)
-    plt.tight_layout()
-    plt.savefig('vizualizacija_arti.png', dpi=150)
-    plt.close()
+    plot_results(
+        f, l, r,
+        points_bis, points_gold, points_newton,
+        (res_bis.x_min, res_bis.f_min), (res_gold.x_min, res_gold.f_min), (res_newton.x_min, res_newton.f_min)
+    )
 
     print("Vizualizacijos išsaugotos failuose: vizualizacija.png, vizualizacija_arti.png")
 
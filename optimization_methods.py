@@ -1,20 +1,40 @@
-t"""
+"""
 Vienmacio optimizavimo metodai:
 1. Intervalo dalijimas pusiau (Bisection)
 2. Auksinio pjuvio metodas (Golden Section)
 3. Niutono metodas (Newton's Method)
+
+Bendra sasaja: minimize_scalar() su metodu registru METODAI.
 """
 
+import time
 import numpy as np
 from typing import Callable, Tuple, Optional
 
 
+class MethodError(ValueError):
+    """
+    Metodo klaida, kai metodo toliau vykdyti negalima (pvz. f''(x) artima nuliui).
+
+    Laukai:
+        iterations: iki klaidos pradetu iteraciju skaicius
+        func_calls: iki klaidos atliktu funkcijos (isvestiniu) skaiciavimu skaicius
+    """
+
+    def __init__(self, message: str, iterations: int, func_calls: int):
+        super().__init__(message)
+        self.iterations = iterations
+        self.func_calls = func_calls
+
+
 def int_dalijimo_pusiau_metodas(
     f: Callable[[float], float],
     l: float,
     r: float,
     epsilon: float = 1e-6,
-    max_iter: int = 1000
+    max_iter: int = 1000,
+    keep_history: bool = True,
+    full_output: bool = False
 ) -> Tuple[float, float, int, int, list]:
     """
     Intervalo dalijimo pusiau metodas optimizavimui.
@@ -33,6 +53,8 @@ def int_dalijimo_pusiau_metodas(
         r: intervalo pabaiga (desinysis galas)
         epsilon: tikslumo riba
         max_iter: maksimalus iteraciju skaicius
+        keep_history: ar kaupti iteraciju istorija (False - grazinamas tuscias sarasas)
+        full_output: ar papildomai grazinti pozymi converged
     
     Grazina:
         x_min: minimumo taskas
@@ -40,6 +62,7 @@ def int_dalijimo_pusiau_metodas(
         iterations: iteraciju skaicius
         func_calls: bendras funkcijos skaiciavimo skaicius
         history: iteraciju istorija
+        converged: ar pasiektas tikslumas (tik kai full_output=True)
     """
     history = []
     func_calls = 0
@@ -53,6 +76,8 @@ def int_dalijimo_pusiau_metodas(
             x_min = (l + r) / 2
             f_min = f(x_min)
             func_calls += 1
+            if full_output:
+                return x_min, f_min, iteration, func_calls, history, True
             return x_min, f_min, iteration, func_calls, history
         
         # intervalo vidurio taskas
@@ -66,18 +91,19 @@ def int_dalijimo_pusiau_metodas(
         f_x2 = f(x_2)
         func_calls += 3
         
-        history.append({
-            'iteration': iteration + 1,
-            'l': l,
-            'r': r,
-            'L': L,
-            'x_m': x_m,
-            'x_1': x_1,
-            'x_2': x_2,
-            'f(x_m)': f_xm,
-            'f(x_1)': f_x1,
-            'f(x_2)': f_x2
-        })
+        if keep_history:
+            history.append({
+                'iteration': iteration + 1,
+                'l': l,
+                'r': r,
+                'L': L,
+                'x_m': x_m,
+                'x_1': x_1,
+                'x_2': x_2,
+                'f(x_m)': f_xm,
+                'f(x_1)': f_x1,
+                'f(x_2)': f_x2
+            })
         
         # intervalo mazinimas
         if f_x1 < f_xm:
@@ -95,6 +121,9 @@ def int_dalijimo_pusiau_metodas(
     x_min = (l + r) / 2
     f_min = f(x_min)
     func_calls += 1
+    if full_output:
+        # paskutinis intervalo mazinimas galejo pasiekti tiksluma
+        return x_min, f_min, max_iter, func_calls, history, (r - l) < epsilon
     return x_min, f_min, max_iter, func_calls, history
 
 
@@ -103,7 +132,9 @@ def auksinio_pjuvio_metodas(
     l: float,
     r: float,
     epsilon: float = 1e-6,
-    max_iter: int = 1000
+    max_iter: int = 1000,
+    keep_history: bool = True,
+    full_output: bool = False
 ) -> Tuple[float, float, int, int, list]:
     """
     Auksinio pjuvio metodas optimizavimui - pagal skaidres.
@@ -123,6 +154,8 @@ def auksinio_pjuvio_metodas(
         r: intervalo pabaiga (dešinysis galas)
         epsilon: tikslumo riba
         max_iter: maksimalus iteraciju skaicius
+        keep_history: ar kaupti iteraciju istorija (False - grazinamas tuscias sarasas)
+        full_output: ar papildomai grazinti pozymi converged
     
     Grazina:
         x_min: minimumo taskas
@@ -130,6 +163,7 @@ def auksinio_pjuvio_metodas(
         iterations: iteraciju skaicius
         func_calls: bendras funkcijos skaiciavimo skaicius
         history: iteraciju istorija
+        converged: ar pasiektas tikslumas (tik kai full_output=True)
     """
     tau = (np.sqrt(5) - 1) / 2  # ≈ 0.618
     func_calls = 0
@@ -146,17 +180,18 @@ def auksinio_pjuvio_metodas(
     while L > epsilon and iterations < max_iter:
         iterations += 1
         
-        history.append({
-            'iteration': iterations,
-            'l': l,
-            'r': r,
-            'L': L,
-            'x_1': x_1,
-            'x_2': x_2,
-            'f(x_1)': f_1,
-            'f(x_2)': f_2,
-            'func_calls': func_calls
-        })
+        if keep_history:
+            history.append({
+                'iteration': iterations,
+                'l': l,
+                'r': r,
+                'L': L,
+                'x_1': x_1,
+                'x_2': x_2,
+                'f(x_1)': f_1,
+                'f(x_2)': f_2,
+                'func_calls': func_calls
+            })
         
         if f_2 < f_1:
             l = x_1
@@ -179,6 +214,8 @@ def auksinio_pjuvio_metodas(
     f_min = f(x_min)
     func_calls += 1
     
+    if full_output:
+        return x_min, f_min, iterations, func_calls, history, L <= epsilon
     return x_min, f_min, iterations, func_calls, history
 
 
@@ -188,7 +225,9 @@ def niutono_metodas(
     d2f: Callable[[float], float],
     x0: float,
     epsilon: float = 1e-6,
-    max_iter: int = 1000
+    max_iter: int = 1000,
+    keep_history: bool = True,
+    full_output: bool = False
 ) -> Tuple[float, float, int, int, list]:
     """
     Niutono metodas optimizavimui.
@@ -220,6 +259,8 @@ def niutono_metodas(
         x0: pradinis taskas
         epsilon: tikslumo riba - algoritmas sustabdomas kai |x_{i+1} - x_i| < epsilon
         max_iter: maksimalus iteraciju skaicius
+        keep_history: ar kaupti iteraciju istorija (False - grazinamas tuscias sarasas)
+        full_output: ar papildomai grazinti pozymi converged
     
     Grazina:
         x_min: minimumo taskas
@@ -227,10 +268,12 @@ def niutono_metodas(
         iterations: iteraciju skaicius
         func_calls: bendras funkcijos (isvestiniu) skaiciavimo skaicius
         history: iteraciju istorija
+        converged: ar pasiektas tikslumas (tik kai full_output=True)
     
     Pastaba:
     Funkcijų skaičiavimams priskiriami f'(x) ir f''(x) įverčiai, nes pats metodas 
     sprendžia f'(x)=0. Funkcija f(x) skaičiuojama tik galutinei minimumo reikšmei.
+    Jei f''(x) artima nuliui, keliama MethodError su iki tol atliktu skaiciavimu skaiciumi.
     """
     x = x0
     history = []
@@ -244,31 +287,291 @@ def niutono_metodas(
         
         # patikrinimas, ar antroji isvestine nera nulis
         if abs(d2fx) < 1e-10:
-            raise ValueError("Antroji išvestinė artima nuliui iteracijoje {}".format(iteration + 1))
+            raise MethodError(
+                "Antroji išvestinė artima nuliui iteracijoje {}".format(iteration + 1),
+                iteration + 1, func_calls
+            )
         
         # Niutono formule: x_{i+1} = x_i - f'(x_i) / f''(x_i)
         x_new = x - dfx / d2fx
         step = abs(x_new - x)
 
-        history.append({
-            'iteration': iteration + 1,
-            'x_i': x,
-            'x_next': x_new,
-            'step': step,
-            "f'(x_i)": dfx,
-            "f''(x_i)": d2fx
-        })
+        if keep_history:
+            history.append({
+                'iteration': iteration + 1,
+                'x_i': x,
+                'x_next': x_new,
+                'step': step,
+                "f'(x_i)": dfx,
+                "f''(x_i)": d2fx
+            })
 
         # patikrinimas, ar pasikeitimas pakankamai mazas
         if step < epsilon:
             x = x_new
             f_min = f(x)
             func_calls += 1
+            if full_output:
+                return x, f_min, iteration + 1, func_calls, history, True
             return x, f_min, iteration + 1, func_calls, history
         
         x = x_new
     
     f_min = f(x)
     func_calls += 1
+    if full_output:
+        return x, f_min, max_iter, func_calls, history, False
     return x, f_min, max_iter, func_calls, history
 
+
+
+# BENDRA SASAJA: METODU REGISTRAS IR minimize_scalar
+
+class OptimizeResult:
+    """
+    Optimizavimo rezultatas.
+
+    Naudojami __slots__, kad daug rezultatu (pvz. perrinkimuose) uzimtu
+    maziau atminties nei zodynai ar iprasti objektai.
+
+    Laukai:
+        x_min: minimumo taskas
+        f_min: funkcijos reiksme minimume
+        iterations: iteraciju skaicius
+        func_calls: funkcijos (isvestiniu) skaiciavimu skaicius
+        method: panaudoto metodo pavadinimas registre
+        success: ar pasiektas tikslumas
+        status: 0 - pasiektas tikslumas, 1 - pasiektas max_iter, 2 - metodo klaida,
+                3 - metodo be intervalo rezultatas uz intervalo ribu arba ne minimumas
+        message: busenos aprasymas
+        time: sprendimo trukme sekundemis
+        history: iteraciju istorija; jei perduota funkcija, ji iskvieciama
+                 tik pirma karta kreipiantis (tingi istorija)
+    """
+
+    __slots__ = (
+        'x_min', 'f_min', 'iterations', 'func_calls', 'method',
+        'success', 'status', 'message', 'time', '_history'
+    )
+
+    def __init__(
+        self,
+        x_min: float,
+        f_min: float,
+        iterations: int,
+        func_calls: int,
+        method: str,
+        status: int = 0,
+        message: str = '',
+        time: float = 0.0,
+        history=None
+    ):
+        self.x_min = x_min
+        self.f_min = f_min
+        self.iterations = iterations
+        self.func_calls = func_calls
+        self.method = method
+        self.status = status
+        self.success = status == 0
+        self.message = message
+        self.time = time
+        self._history = history
+
+    @property
+    def history(self) -> Optional[list]:
+        if callable(self._history):
+            self._history = self._history()
+        return self._history
+
+    def as_tuple(self) -> Tuple[float, float, int, int, list]:
+        """grazina rezultata senuoju (x_min, f_min, iterations, func_calls, history) formatu"""
+        return self.x_min, self.f_min, self.iterations, self.func_calls, self.history
+
+    def __repr__(self):
+        return (
+            "OptimizeResult(method={!r}, x_min={}, f_min={}, iterations={}, func_calls={}, "
+            "status={}, time={:.2e})".format(
+                self.method, self.x_min, self.f_min, self.iterations,
+                self.func_calls, self.status, self.time
+            )
+        )
+
+
+# metodo pavadinimas -> {'solver', 'bracket', 'derivatives', 'cost'}
+METODAI = {}
+
+
+def register_method(name: str, bracket: bool, derivatives: int, cost: float):
+    """
+    Registruoja metoda minimize_scalar dispeceriui (naudojama kaip dekoratorius).
+
+    Registruojama funkcija turi priimti (f, df, d2f, bracket, x0, epsilon,
+    max_iter, keep_history) ir grazinti (x_min, f_min, iterations, func_calls,
+    history, converged).
+
+    Parametrai:
+        name: metodo pavadinimas
+        bracket: ar metodui reikalingas intervalas [l, r]
+        derivatives: kiek isvestiniu reikia (0, 1 arba 2)
+        cost: santykine kaina, pagal kuria 'auto' renkasi pigiausia tinkama metoda
+    """
+    def decorator(solver):
+        METODAI[name] = {'solver': solver, 'bracket': bracket, 'derivatives': derivatives, 'cost': cost}
+        return solver
+    return decorator
+
+
+@register_method('pusiau', bracket=True, derivatives=0, cost=3)
+def _pusiau(f, df, d2f, bracket, x0, epsilon, max_iter, keep_history):
+    return int_dalijimo_pusiau_metodas(f, bracket[0], bracket[1], epsilon, max_iter, keep_history, True)
+
+
+@register_method('auksinis', bracket=True, derivatives=0, cost=2)
+def _auksinis(f, df, d2f, bracket, x0, epsilon, max_iter, keep_history):
+    return auksinio_pjuvio_metodas(f, bracket[0], bracket[1], epsilon, max_iter, keep_history, True)
+
+
+@register_method('niutono', bracket=False, derivatives=2, cost=1)
+def _niutono(f, df, d2f, bracket, x0, epsilon, max_iter, keep_history):
+    if x0 is None:
+        x0 = (bracket[0] + bracket[1]) / 2
+    return niutono_metodas(f, df, d2f, x0, epsilon, max_iter, keep_history, True)
+
+
+def choose_method(
+    bracket: Optional[Tuple[float, float]] = None,
+    x0: Optional[float] = None,
+    df: Optional[Callable[[float], float]] = None,
+    d2f: Optional[Callable[[float], float]] = None,
+    bracket_only: bool = False
+) -> str:
+    """
+    Parenka pigiausia registruota metoda, kuriam pakanka turimu duomenu.
+
+    Metodas be intervalo reikalauja pradinio tasko x0 (arba intervalo, is kurio
+    imamas vidurys), o metodas su isvestinemis - atitinkamu df ir d2f.
+    Su bracket_only=True renkamasi tik is intervalo metodu.
+    """
+    if df is None:
+        available = 0
+    else:
+        available = 2 if d2f is not None else 1
+    candidates = [
+        (spec['cost'], name) for name, spec in METODAI.items()
+        if (bracket is not None or (not spec['bracket'] and x0 is not None))
+        and spec['derivatives'] <= available
+        and (spec['bracket'] or not bracket_only)
+    ]
+    if not candidates:
+        raise ValueError("Nera metodo, kuriam pakaktu pateiktu duomenu (reikia intervalo arba x0 su isvestinemis)")
+    return min(candidates)[1]
+
+
+def _run_method(method, f, df, d2f, bracket, x0, epsilon, max_iter, history) -> OptimizeResult:
+    """Iskviecia registruota metoda ir suformuoja OptimizeResult."""
+    solver = METODAI[method]['solver']
+    start = time.perf_counter()
+    try:
+        x_min, f_min, iterations, func_calls, hist, converged = solver(
+            f, df, d2f, bracket, x0, epsilon, max_iter, history is True
+        )
+    except MethodError as e:
+        # tik paties metodo klaidos; vartotojo f/df/d2f isimtys keliamos toliau
+        return OptimizeResult(float('nan'), float('nan'), e.iterations, e.func_calls, method, status=2,
+                              message=str(e), time=time.perf_counter() - start,
+                              history=[] if history is True else None)
+
+    if converged:
+        status, message = 0, "Pasiektas tikslumas"
+    else:
+        status, message = 1, "Pasiektas maksimalus iteraciju skaicius"
+
+    # metodas be intervalo (Niutono) intervalo nepaiso, todel tikrinama, ar rastas
+    # taskas yra intervale ir ar tai minimumas (f''(x) > 0), o ne maksimumas;
+    # sis patikrinimas i func_calls neiskaiciuojamas, kad skaicius sutaptu su metodo
+    if bracket is not None and not METODAI[method]['bracket']:
+        in_bracket = bracket[0] <= x_min <= bracket[1]
+        is_minimum = True
+        if in_bracket and d2f is not None:
+            is_minimum = d2f(x_min) > 0
+        if not in_bracket:
+            status, message = 3, "Rastas taskas {} yra uz intervalo {} ribu".format(x_min, tuple(bracket))
+        elif not is_minimum:
+            status, message = 3, "Rastame taske {} f''(x) <= 0, tai ne minimumas".format(x_min)
+    elapsed = time.perf_counter() - start
+
+    if history == 'lazy':
+        def hist():
+            # metodai deterministiniai, todel pakartotinis sprendimas duoda ta pacia istorija
+            return solver(f, df, d2f, bracket, x0, epsilon, max_iter, True)[4]
+    elif history is False:
+        hist = None
+
+    return OptimizeResult(x_min, f_min, iterations, func_calls, method, status=status,
+                          message=message, time=elapsed, history=hist)
+
+
+def minimize_scalar(
+    f: Callable[[float], float],
+    bracket: Optional[Tuple[float, float]] = None,
+    x0: Optional[float] = None,
+    df: Optional[Callable[[float], float]] = None,
+    d2f: Optional[Callable[[float], float]] = None,
+    method: str = 'auto',
+    epsilon: float = 1e-6,
+    max_iter: int = 1000,
+    history=True
+) -> OptimizeResult:
+    """
+    Bendra vienmacio optimizavimo sasaja per metodu registra METODAI.
+
+    Parametrai:
+        f: tikslo funkcija
+        bracket: intervalas (l, r) intervalu metodams
+        x0: pradinis taskas Niutono metodui
+        df, d2f: pirmoji ir antroji isvestines
+        method: metodo pavadinimas registre arba 'auto'
+        epsilon: tikslumo riba
+        max_iter: maksimalus iteraciju skaicius
+        history: True - kaupti istorija, False - nekaupti,
+                 'lazy' - nekaupti, o pirma karta kreipiantis i result.history
+                 sprendima pakartoti su istorija
+
+    Grazina:
+        OptimizeResult
+
+    Pastaba:
+    Metodo klaida (MethodError, pvz. f''(x) artima nuliui) neiskeliama, o grazinama
+    kaip status = 2 su pranesimu message ir iki klaidos atliktu skaiciavimu skaiciumi.
+    Kitos isimtys (pvz. is paties f) keliamos toliau. Jei pateiktas intervalas, metodo be intervalo
+    rezultatas uz intervalo ribu arba ne minimume grazinamas su status = 3.
+    Su 'auto' tokiu atveju (ir kai metodas nepavyko) sprendziama pigiausiu
+    intervalo metodu; func_calls ir time tada apima abu bandymus.
+    """
+    if not (isinstance(history, bool) or history == 'lazy'):
+        raise ValueError("history turi buti True, False arba 'lazy'")
+    auto = method == 'auto'
+    if auto:
+        method = choose_method(bracket, x0, df, d2f)
+    if method not in METODAI:
+        raise ValueError("Nezinomas metodas: {}".format(method))
+
+    spec = METODAI[method]
+    if spec['bracket'] and bracket is None:
+        raise ValueError("Metodui {} reikalingas intervalas bracket".format(method))
+    if not spec['bracket'] and bracket is None and x0 is None:
+        raise ValueError("Metodui {} reikalingas pradinis taskas x0".format(method))
+    if spec['derivatives'] >= 1 and df is None or spec['derivatives'] >= 2 and d2f is None:
+        raise ValueError("Metodui {} reikalingos isvestines".format(method))
+
+    result = _run_method(method, f, df, d2f, bracket, x0, epsilon, max_iter, history)
+    if auto and not result.success and bracket is not None and not spec['bracket']:
+        fallback = _run_method(
+            choose_method(bracket, x0, df, d2f, bracket_only=True),
+            f, df, d2f, bracket, x0, epsilon, max_iter, history
+        )
+        fallback.func_calls += result.func_calls
+        fallback.time += result.time
+        fallback.message += " ({} rezultatas atmestas: {})".format(method, result.message)
+        return fallback
+    return result
@@ -0,0 +1,353 @@
+"""
+Parametru perrinkimas (sweep) per (a, b, epsilon, metodas) kombinacijas.
+
+Tinklelis suskaidomas i dalis (shard), kurios per failine eile isdalinamos
+lokaliems darbiniams procesams. Kiekvienos dalies rezultatai issaugomi
+atskirame faile, todel nutrukus darbui pakartotinis paleidimas skaiciuoja
+tik trukstamas dalis.
+
+Katalogo struktura:
+    grid.json        - tinklelio aprasas (tikrinamas pratesiant darba)
+    queue/           - dar neapdorotos dalys
+    running/         - siuo metu apdorojamos dalys
+    results/         - baigtu daliu rezultatai
+"""
+
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import time
+from typing import Iterable, List, Optional
+
+from optimization_methods import METODAI, minimize_scalar
+from lab_task import create_objective_function
+
+
+# metodo raktas -> pavadinimas lentelei
+PAVADINIMAI = {
+    'pusiau': 'Dalijimas pusiau',
+    'auksinis': 'Auksinis pjūvis',
+    'niutono': 'Niutono metodas',
+    'auto': 'Automatinis',
+}
+
+
+def build_grid(
+    a_values: Iterable[float],
+    b_values: Iterable[float],
+    epsilons: Iterable[float],
+    methods: Iterable[str]
+) -> List[dict]:
+    """
+    sudaro visų (a, b, epsilon, metodas) kombinacijų sąrašą.
+
+    parametrai:
+        a_values, b_values: tikslo funkcijos parametrų reikšmės
+        epsilons: tikslumo ribos
+        methods: metodų raktai iš optimization_methods.METODAI arba 'auto'
+    grąžina:
+        konfigūracijų (dict) sąrašas, tvarka deterministinė
+    """
+    methods = list(methods)
+    for method in methods:
+        if method != 'auto' and method not in METODAI:
+            raise ValueError("Nežinomas metodas: {}".format(method))
+
+    grid = []
+    for a, b, epsilon, method in itertools.product(a_values, b_values, epsilons, methods):
+        if b == 0:
+            raise ValueError("Parametras b negali būti 0")
+        grid.append({'a': a, 'b': b, 'epsilon': epsilon, 'method': method})
+    return grid
+
+
+def run_config(config: dict, l: float = 0, r: float = 10, x0: float = 5) -> dict:
+    """
+    išsprendžia vieną konfigūraciją ir grąžina rezultatų eilutę (be istorijos).
+
+    Metodo klaida (pvz. Niutono f''(x) ≈ 0) ar atmestas rezultatas (status ≥ 2)
+    neperkrauna viso perrinkimo - jie įrašomi į eilutės 'error' lauką.
+    'method' lieka toks, koks prašytas, o faktiškai panaudotas metodas
+    (svarbu su 'auto') įrašomas į 'resolved_method'.
+    """
+    f, df, d2f = create_objective_function(config['a'], config['b'])
+    res = minimize_scalar(f, bracket=(l, r), x0=x0, df=df, d2f=d2f, method=config['method'],
+                          epsilon=config['epsilon'], history=False)
+
+    row = dict(config)
+    row['resolved_method'] = res.method
+    if res.status >= 2:
+        row.update({'x_min': None, 'f_min': None, 'iterations': None, 'func_calls': None, 'error': res.message})
+    else:
+        row.update({
+            'x_min': float(res.x_min),
+            'f_min': float(res.f_min),
+            'iterations': int(res.iterations),
+            'func_calls': int(res.func_calls),
+            'error': None
+        })
+    row['time'] = res.time
+    return row
+
+
+def reference_minimizers(a: float, b: float, l: float, r: float) -> List[float]:
+    """
+    grąžina tikslo funkcijos globalaus minimumo taškus intervale [l, r].
+
+    kandidatai yra intervalo galai ir stacionarūs taškai ±√a (arba 0, kai a ≤ 0),
+    patenkantys į intervalą; grąžinami visi, kuriuose f(x) mažiausia.
+    """
+    f, _, _ = create_objective_function(a, b)
+    stationary = [-math.sqrt(a), math.sqrt(a)] if a > 0 else [0.0]
+    candidates = [l, r] + [x for x in stationary if l <= x <= r]
+    f_best = min(f(x) for x in candidates)
+    return sorted({x for x in candidates if f(x) <= f_best})
+
+
+class SweepAggregator:
+    """
+    kaupia suvestinę statistiką kiekvienam prašytam metodui ('auto' - atskira eilutė),
+    nelaikydamas visų eilučių atmintyje.
+
+    paklaida skaičiuojama iki artimiausio tikrojo minimumo taško intervale [l, r]
+    (žr. reference_minimizers).
+    """
+
+    def __init__(self, l: float = 0, r: float = 10):
+        self.l = l
+        self.r = r
+        self.stats = {}
+
+    def update(self, rows: Iterable[dict]):
+        for row in rows:
+            if row['method'] not in self.stats:
+                self.stats[row['method']] = {
+                    'n': 0, 'errors': 0, 'iterations': 0, 'func_calls': 0, 'time': 0.0, 'max_err': 0.0
+                }
+            s = self.stats[row['method']]
+            if row['error'] is not None:
+                s['errors'] += 1
+                continue
+            s['n'] += 1
+            s['iterations'] += row['iterations']
+            s['func_calls'] += row['func_calls']
+            s['time'] += row['time']
+            err = min(abs(row['x_min'] - x) for x in reference_minimizers(row['a'], row['b'], self.l, self.r))
+            s['max_err'] = max(s['max_err'], err)
+
+    def format_table(self) -> str:
+        lines = [
+            f"{'Metodas':<20} {'Sprendimai':<12} {'Klaidos':<10} {'Vid. žingsn.':<14} "
+            f"{'Vid. f skaič.':<15} {'Maks. |x*-x_t|':<15} {'Vid. laikas, s':<14}",
+            '-' * 104
+        ]
+        for method, s in self.stats.items():
+            name = PAVADINIMAI.get(method, method)
+            n = max(s['n'], 1)
+            lines.append(
+                f"{name:<20} {s['n']:<12} {s['errors']:<10} {s['iterations'] / n:<14.2f} "
+                f"{s['func_calls'] / n:<15.2f} {s['max_err']:<15.2e} {s['time'] / n:<14.2e}"
+            )
+        return '\n'.join(lines)
+
+
+def _shard_name(shard_id: int) -> str:
+    return 'shard_{:06d}.json'.format(shard_id)
+
+
+def _write_json_atomic(path: str, data):
+    """įrašo JSON per laikiną failą, kad nutrūkus procesui neliktų pusiau įrašyto failo"""
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh)
+    os.replace(tmp_path, path)
+
+
+def prepare_sweep_dir(sweep_dir: str, grid: List[dict], shard_size: int, bounds: dict) -> List[int]:
+    """
+    paruošia katalogą ir eilę. Jei katalogas jau naudotas, tikrinama, ar tinklelis
+    sutampa, o nebaigtos dalys (ir likusios running/ po nutrūkimo) grąžinamos į eilę.
+
+    grąžina:
+        baigtų dalių numerių sąrašas
+    """
+    for sub in ('queue', 'running', 'results'):
+        os.makedirs(os.path.join(sweep_dir, sub), exist_ok=True)
+
+    manifest = {'grid': grid, 'shard_size': shard_size, 'bounds': bounds}
+    manifest_path = os.path.join(sweep_dir, 'grid.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as fh:
+            if json.load(fh) != manifest:
+                raise ValueError("Kataloge {} jau yra kito tinklelio rezultatai".format(sweep_dir))
+    else:
+        _write_json_atomic(manifest_path, manifest)
+
+    # nutrūkusio darbo likučiai grąžinami į eilę
+    for name in os.listdir(os.path.join(sweep_dir, 'running')):
+        os.replace(os.path.join(sweep_dir, 'running', name), os.path.join(sweep_dir, 'queue', name))
+
+    done = []
+    for shard_id, start in enumerate(range(0, len(grid), shard_size)):
+        name = _shard_name(shard_id)
+        queue_path = os.path.join(sweep_dir, 'queue', name)
+        if os.path.exists(os.path.join(sweep_dir, 'results', name)):
+            done.append(shard_id)
+            if os.path.exists(queue_path):
+                os.remove(queue_path)
+        elif not os.path.exists(queue_path):
+            _write_json_atomic(queue_path, {'shard_id': shard_id, 'configs': grid[start:start + shard_size]})
+    return done
+
+
+def _claim_job(sweep_dir: str) -> Optional[str]:
+    """paima kitą dalį iš eilės; os.replace užtikrina, kad ją gaus tik vienas procesas"""
+    queue_dir = os.path.join(sweep_dir, 'queue')
+    for name in sorted(os.listdir(queue_dir)):
+        if not name.endswith('.json'):
+            continue
+        try:
+            os.replace(os.path.join(queue_dir, name), os.path.join(sweep_dir, 'running', name))
+        except FileNotFoundError:
+            # kitas procesas spėjo paimti
+            continue
+        return name
+    return None
+
+
+def _worker(sweep_dir: str, bounds: dict):
+    """darbinis procesas: ima dalis iš eilės, kol ji ištuštėja"""
+    while True:
+        name = _claim_job(sweep_dir)
+        if name is None:
+            return
+        running_path = os.path.join(sweep_dir, 'running', name)
+        with open(running_path, encoding='utf-8') as fh:
+            job = json.load(fh)
+        rows = [run_config(config, **bounds) for config in job['configs']]
+        _write_json_atomic(os.path.join(sweep_dir, 'results', name), rows)
+        os.remove(running_path)
+
+
+def _read_results(sweep_dir: str, shard_id: int) -> List[dict]:
+    with open(os.path.join(sweep_dir, 'results', _shard_name(shard_id)), encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def run_sweep(
+    sweep_dir: str,
+    grid: List[dict],
+    workers: int = None,
+    shard_size: int = 50,
+    l: float = 0,
+    r: float = 10,
+    x0: float = 5,
+    report_every: int = 10,
+    verbose: bool = True
+) -> SweepAggregator:
+    """
+    paleidžia (arba pratęsia) perrinkimą per lokalų procesų telkinį.
+
+    parametrai:
+        sweep_dir: katalogas eilei ir rezultatams
+        grid: konfigūracijų sąrašas (žr. build_grid)
+        workers: darbinių procesų skaičius (numatytai os.cpu_count())
+        shard_size: konfigūracijų skaičius vienoje dalyje
+        l, r: intervalas intervalų metodams
+        x0: pradinis taškas Niutono metodui
+        report_every: kas kiek baigtų dalių spausdinti suvestinės lentelę
+        verbose: ar spausdinti eigą
+    grąžina:
+        SweepAggregator su visų baigtų dalių suvestine
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size turi būti teigiamas")
+    workers = workers or os.cpu_count() or 1
+    bounds = {'l': l, 'r': r, 'x0': x0}
+
+    n_shards = math.ceil(len(grid) / shard_size)
+    done = set(prepare_sweep_dir(sweep_dir, grid, shard_size, bounds))
+
+    aggregator = SweepAggregator(l, r)
+    for shard_id in sorted(done):
+        aggregator.update(_read_results(sweep_dir, shard_id))
+
+    if verbose:
+        print(f"Dalių: {n_shards}, jau baigta: {len(done)}, liko: {n_shards - len(done)}")
+
+    procs = []
+    if len(done) < n_shards:
+        for _ in range(min(workers, n_shards - len(done))):
+            p = multiprocessing.Process(target=_worker, args=(sweep_dir, bounds))
+            p.start()
+            procs.append(p)
+
+    new_since_report = 0
+    while True:
+        alive = any(p.is_alive() for p in procs)
+        # vienas katalogo skaitymas per ciklą, o ne po stat() kiekvienai daliai
+        finished = sorted(
+            int(name[len('shard_'):-len('.json')])
+            for name in os.listdir(os.path.join(sweep_dir, 'results'))
+            if name.startswith('shard_') and name.endswith('.json')
+        )
+        for shard_id in finished:
+            if shard_id in done:
+                continue
+            aggregator.update(_read_results(sweep_dir, shard_id))
+            done.add(shard_id)
+            new_since_report += 1
+            if verbose:
+                print(f"  baigta dalis {shard_id} ({len(done)}/{n_shards})")
+        if verbose and new_since_report >= report_every:
+            print(aggregator.format_table())
+            new_since_report = 0
+        if not alive:
+            break
+        time.sleep(0.2)
+
+    for p in procs:
+        p.join()
+
+    if verbose:
+        print(f"\n{'='*104}")
+        print("SUVESTINĖ")
+        print(f"{'='*104}")
+        print(aggregator.format_table())
+        missing = n_shards - len(done)
+        if missing:
+            print(f"\nNebaigtų dalių: {missing} (paleiskite dar kartą, kad būtų pratęsta)")
+    return aggregator
+
+
+def _parse_floats(text: str) -> List[float]:
+    return [float(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parametrų perrinkimas su tarpiniais rezultatais")
+    parser.add_argument('sweep_dir', help="katalogas eilei ir rezultatams")
+    parser.add_argument('--a', default='0,1,2,3,4,5,6,7,8,9', help="a reikšmės, atskirtos kableliais")
+    parser.add_argument('--b', default='1,2,3,4,5,6,7,8,9', help="b reikšmės, atskirtos kableliais")
+    parser.add_argument('--eps', default='1e-2,1e-4,1e-6', help="tikslumo ribos, atskirtos kableliais")
+    parser.add_argument('--methods', default=','.join(PAVADINIMAI), help="metodai, atskirti kableliais")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--shard-size', type=int, default=50)
+    parser.add_argument('--report-every', type=int, default=10)
+    args = parser.parse_args()
+
+    grid = build_grid(
+        _parse_floats(args.a),
+        _parse_floats(args.b),
+        _parse_floats(args.eps),
+        [m.strip() for m in args.methods.split(',') if m.strip()]
+    )
+    run_sweep(args.sweep_dir, grid, workers=args.workers, shard_size=args.shard_size,
+              report_every=args.report_every)
+
+
+if __name__ == "__main__":
+    main()
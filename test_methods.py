@@ -1,5 +1,6 @@
-from optimization_methods import bisection_method, golden_section_method, newton_method
+from optimization_methods import minimize_scalar, choose_method, OptimizeResult, niutono_metodas
 import numpy as np
+import pytest
 
 
 def print_results(method_name: str, x_min: float, f_min: float, iterations: int):
@@ -38,24 +39,24 @@ def test_basic_quadratic():
     epsilon = 1e-6
     
     # 1. int dalijimo pusiau metodas
-    x_min_bis, f_min_bis, iter_bis, history_bis = bisection_method(f, l, r, epsilon)
-    print_results("INTERVALO DALIJIMO PUSIAU METODAS", x_min_bis, f_min_bis, iter_bis)
+    res_bis = minimize_scalar(f, bracket=(l, r), method='pusiau', epsilon=epsilon)
+    print_results("INTERVALO DALIJIMO PUSIAU METODAS", res_bis.x_min, res_bis.f_min, res_bis.iterations)
     
-    if history_bis:
+    if res_bis.history:
         print("\npirmosios iteracijos detali informacija:")
-        h = history_bis[0]
+        h = res_bis.history[0]
         print(f"  l = {h['l']:.2f}; r = {h['r']:.2f}; L = {h['L']:.2f}; x_m = {h['x_m']:.2f}")
         print(f"  x_1 = l + L/4 = {h['l']:.2f} + {h['L']:.2f}/4 = {h['x_1']:.2f}")
         print(f"  x_2 = r - L/4 = {h['r']:.2f} - {h['L']:.2f}/4 = {h['x_2']:.2f}")
         print(f"  f(x_1) = {h['f(x_1)']:.4f}; f(x_m) = {h['f(x_m)']:.4f}; f(x_2) = {h['f(x_2)']:.4f}")
     
     # 2. Auksinio pjūvio metodas
-    x_min_gold, f_min_gold, iter_gold, history_gold = golden_section_method(f, l, r, epsilon)
-    print_results("AUKSINIO PJŪVIO METODAS", x_min_gold, f_min_gold, iter_gold)
+    res_gold = minimize_scalar(f, bracket=(l, r), method='auksinis', epsilon=epsilon)
+    print_results("AUKSINIO PJŪVIO METODAS", res_gold.x_min, res_gold.f_min, res_gold.iterations)
     
     # 3. Niutono metodas
-    x_min_newton, f_min_newton, iter_newton, history_newton = newton_method(f, df, d2f, x0, epsilon)
-    print_results("NIUTONO METODAS", x_min_newton, f_min_newton, iter_newton)
+    res_newton = minimize_scalar(f, x0=x0, df=df, d2f=d2f, method='niutono', epsilon=epsilon)
+    print_results("NIUTONO METODAS", res_newton.x_min, res_newton.f_min, res_newton.iterations)
     
     # palyginimas
     print(f"\n{'='*60}")
@@ -63,10 +64,15 @@ def test_basic_quadratic():
     print(f"{'='*60}")
     print(f"{'Metodas':<30} {'Iteracijos':<15} {'Tikslumas':<15}")
     print(f"{'-'*60}")
-    print(f"{'Dalijimas pusiau':<30} {iter_bis:<15} {abs(x_min_bis - 2):.2e}")
-    print(f"{'Auksinis pjūvis':<30} {iter_gold:<15} {abs(x_min_gold - 2):.2e}")
-    print(f"{'Niutono metodas':<30} {iter_newton:<15} {abs(x_min_newton - 2):.2e}")
+    print(f"{'Dalijimas pusiau':<30} {res_bis.iterations:<15} {abs(res_bis.x_min - 2):.2e}")
+    print(f"{'Auksinis pjūvis':<30} {res_gold.iterations:<15} {abs(res_gold.x_min - 2):.2e}")
+    print(f"{'Niutono metodas':<30} {res_newton.iterations:<15} {abs(res_newton.x_min - 2):.2e}")
     print(f"{'='*60}")
+    
+    for res in (res_bis, res_gold, res_newton):
+        assert res.success
+        assert abs(res.x_min - 2) < epsilon
+        assert abs(res.f_min - 1) < epsilon
 
 
 # PAVYZDŽIAI IŠ SKAIDRIŲ
@@ -81,7 +87,9 @@ def test_bisection_from_slides():
     def f(x):
         return (100 - x)**2
     
-    x_min, f_min, iterations, history = bisection_method(f, 60, 150, epsilon=1e-6)
+    res = minimize_scalar(f, bracket=(60, 150), method='pusiau', epsilon=1e-6)
+    x_min, f_min, iterations, history = res.x_min, res.f_min, res.iterations, res.history
+    assert abs(x_min - 100) < 1e-6
     
     print(f"\nRastas minimumas: x* = {x_min:.6f}, f(x*) = {f_min:.6f}")
     print(f"Tikrasis minimumas: x* = 100, f(x*) = 0")
@@ -115,7 +123,9 @@ def test_golden_section_from_slides():
     print(f"\nAuksinio pjūvio konstanta: τ = (√5 - 1)/2 = {tau:.5f}")
     print(f"τ² = 1 - τ = {1 - tau:.5f}")
     
-    x_min, f_min, iterations, history = golden_section_method(f, 0, 1, epsilon=1e-6)
+    res = minimize_scalar(f, bracket=(0, 1), method='auksinis', epsilon=1e-6)
+    x_min, f_min, iterations, history = res.x_min, res.f_min, res.iterations, res.history
+    assert abs(x_min - 40/90) < 1e-6
     
     print(f"\nRastas minimumas: w* = {x_min:.8f}")
     print(f"Funkcijos reikšmė: f(w*) = {f_min:.8f}")
@@ -141,6 +151,193 @@ def test_golden_section_from_slides():
             print(f"  f(w_1) < f(w_2), todėl intervalas ({h['x_2']:.3f}; {h['r']:.3f}] atmetamas")
 
 
+# BENDRA SASAJA
+
+def test_auto_method_choice():
+    """'auto' parenka pigiausią metodą pagal turimas išvestines ir intervalą"""
+    def f(x):
+        return (x - 2)**2 + 1
+    
+    def df(x):
+        return 2 * (x - 2)
+    
+    def d2f(x):
+        return 2
+    
+    assert choose_method(bracket=(0, 5)) == 'auksinis'
+    assert choose_method(bracket=(0, 5), df=df, d2f=d2f) == 'niutono'
+    assert choose_method(x0=0, df=df, d2f=d2f) == 'niutono'
+    
+    res = minimize_scalar(f, bracket=(0, 5), epsilon=1e-6)
+    assert isinstance(res, OptimizeResult)
+    assert res.method == 'auksinis'
+    assert abs(res.x_min - 2) < 1e-6
+    
+    # be intervalo ir be išvestinių spręsti negalima
+    with pytest.raises(ValueError):
+        minimize_scalar(f, x0=0)
+
+
+def test_auto_respects_bracket():
+    """'auto' nepriima Niutono rezultato už intervalo ribų arba maksimume"""
+    # f(x) = (x² - 4)² - 1: intervale [-1, 1] Niutonas iš vidurio x = 0 randa maksimumą
+    def f(x):
+        return (x**2 - 4)**2 - 1
+    
+    def df(x):
+        return 4 * x * (x**2 - 4)
+    
+    def d2f(x):
+        return 12 * x**2 - 16
+    
+    res = minimize_scalar(f, bracket=(-1, 1), df=df, d2f=d2f)
+    assert res.success
+    assert res.method == 'auksinis'
+    assert -1 <= res.x_min <= 1
+    assert abs(abs(res.x_min) - 1) < 1e-5
+    assert abs(res.f_min - 8) < 1e-4
+    
+    # aiškiai pasirinktas Niutonas grąžina nesėkmės būseną
+    res = minimize_scalar(f, bracket=(-1, 1), df=df, d2f=d2f, method='niutono')
+    assert not res.success
+    assert res.status == 3
+    
+    # minimumas už intervalo ribų
+    res = minimize_scalar(f, bracket=(2.5, 4), x0=1.5, df=df, d2f=d2f, method='niutono')
+    assert res.status == 3
+    res = minimize_scalar(f, bracket=(2.5, 4), x0=1.5, df=df, d2f=d2f)
+    assert res.success and abs(res.x_min - 2.5) < 1e-5
+
+
+def test_auto_falls_back_on_newton_error():
+    """f(x) = x⁴ - 1: ties minimumu f''(x) → 0, Niutonas nepavyksta, 'auto' naudoja intervalo metodą"""
+    calls = {'n': 0}
+    
+    def f(x):
+        calls['n'] += 1
+        return x**4 - 1
+    
+    def df(x):
+        calls['n'] += 1
+        return 4 * x**3
+    
+    def d2f(x):
+        calls['n'] += 1
+        return 12 * x**2
+    
+    newton = minimize_scalar(f, bracket=(0, 10), df=df, d2f=d2f, method='niutono')
+    assert newton.status == 2
+    # iki klaidos atlikti skaičiavimai neprarandami
+    assert newton.iterations > 0
+    assert newton.func_calls == calls['n'] > 0
+    
+    calls['n'] = 0
+    golden = minimize_scalar(f, bracket=(0, 10), method='auksinis')
+    assert golden.func_calls == calls['n']
+    
+    calls['n'] = 0
+    res = minimize_scalar(f, bracket=(0, 10), df=df, d2f=d2f)
+    assert res.success
+    assert res.method == 'auksinis'
+    assert abs(res.x_min) < 1e-5
+    # func_calls apima ir nepavykusį Niutono bandymą
+    assert res.func_calls == newton.func_calls + golden.func_calls == calls['n']
+
+
+def test_bracket_check_not_counted():
+    """intervalo patikrinimas f''(x*) > 0 neįskaičiuojamas į Niutono func_calls"""
+    def f(x):
+        return (x - 2)**2 + 1
+    
+    def df(x):
+        return 2 * (x - 2)
+    
+    def d2f(x):
+        return 2
+    
+    _, _, iterations, func_calls, _ = niutono_metodas(f, df, d2f, 5)
+    res = minimize_scalar(f, bracket=(0, 10), x0=5, df=df, d2f=d2f, method='niutono')
+    assert res.success
+    assert (res.iterations, res.func_calls) == (iterations, func_calls)
+
+
+def test_user_errors_propagate():
+    """išimtis iš paties f nepaverčiama metodo klaida (status = 2)"""
+    def f(x):
+        raise ValueError("vartotojo klaida")
+    
+    for method in ('pusiau', 'auksinis'):
+        with pytest.raises(ValueError, match='vartotojo klaida'):
+            minimize_scalar(f, bracket=(0, 1), method=method)
+
+
+def test_history_modes():
+    """istorija kaupiama, nekaupiama arba skaičiuojama tik pareikalavus"""
+    def f(x):
+        return (100 - x)**2
+    
+    full = minimize_scalar(f, bracket=(60, 150), method='pusiau')
+    none = minimize_scalar(f, bracket=(60, 150), method='pusiau', history=False)
+    lazy = minimize_scalar(f, bracket=(60, 150), method='pusiau', history='lazy')
+    
+    assert len(full.history) == full.iterations
+    assert none.history is None
+    assert lazy.history == full.history
+    assert none.x_min == full.x_min and none.func_calls == full.func_calls
+
+
+def test_history_must_be_bool_or_lazy():
+    """1 ir 0 nėra priimami vietoj True ir False"""
+    def f(x):
+        return (x - 2)**2
+    
+    for history in (1, 0, 'full', None):
+        with pytest.raises(ValueError):
+            minimize_scalar(f, bracket=(0, 5), history=history)
+
+
+def test_converged_on_last_iteration():
+    """pasiekus tikslumą paskutinėje leistinoje iteracijoje, status = 0"""
+    def f(x):
+        return (x - 2)**2
+    
+    def df(x):
+        return 2 * (x - 2)
+    
+    def d2f(x):
+        return 2
+    
+    # Niutonas kvadratinei funkcijai: 1 žingsnis į minimumą, 2-as patvirtina
+    res = minimize_scalar(f, x0=0, df=df, d2f=d2f, method='niutono', max_iter=2)
+    assert res.iterations == 2
+    assert res.status == 0
+    res = minimize_scalar(f, x0=0, df=df, d2f=d2f, method='niutono', max_iter=1)
+    assert res.status == 1
+    
+    for method in ('pusiau', 'auksinis'):
+        needed = minimize_scalar(f, bracket=(0, 5), method=method, epsilon=1e-4).iterations
+        res = minimize_scalar(f, bracket=(0, 5), method=method, epsilon=1e-4, max_iter=needed)
+        assert res.status == 0, method
+        res = minimize_scalar(f, bracket=(0, 5), method=method, epsilon=1e-4, max_iter=needed - 1)
+        assert res.status == 1, method
+
+
+def test_method_error_status():
+    """Niutono metodo klaida grąžinama kaip status = 2, o ne išimtis"""
+    def f(x):
+        return x**3
+    
+    def df(x):
+        return 3 * x**2
+    
+    def d2f(x):
+        return 6 * x
+    
+    res = minimize_scalar(f, x0=0, df=df, d2f=d2f, method='niutono')
+    assert not res.success
+    assert res.status == 2
+
+
 # VISI TESTAI
 
 if __name__ == "__main__":
@@ -151,6 +348,17 @@ if __name__ == "__main__":
     test_bisection_from_slides()
     test_golden_section_from_slides()
     
+    # bendra sasaja
+    test_auto_method_choice()
+    test_auto_respects_bracket()
+    test_auto_falls_back_on_newton_error()
+    test_user_errors_propagate()
+    test_bracket_check_not_counted()
+    test_history_must_be_bool_or_lazy()
+    test_converged_on_last_iteration()
+    test_history_modes()
+    test_method_error_status()
+    
     print("\n\n" + "="*70)
     print("TESTAI BAIGTI!")
     print("="*70)
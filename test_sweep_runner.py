@@ -0,0 +1,165 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sweep_runner import (
+    SweepAggregator, build_grid, prepare_sweep_dir, reference_minimizers,
+    run_config, run_sweep, _claim_job, _shard_name
+)
+
+
+BOUNDS = {'l': 0, 'r': 10, 'x0': 5}
+
+
+def small_grid():
+    """12 konfigūracijų: 2 a × 2 b × 1 ε × 3 metodai"""
+    return build_grid([4, 6], [1, 7], [1e-4], ['pusiau', 'auksinis', 'niutono'])
+
+
+# EILĖ IR PRATĘSIMAS
+
+def test_prepare_requeues_running(tmp_path):
+    """po nutrūkimo running/ likusios dalys grąžinamos į queue/"""
+    sweep_dir = str(tmp_path)
+    grid = small_grid()
+    assert prepare_sweep_dir(sweep_dir, grid, 5, BOUNDS) == []
+    assert sorted(os.listdir(tmp_path / 'queue')) == [_shard_name(i) for i in range(3)]
+
+    name = _claim_job(sweep_dir)
+    assert name == _shard_name(0)
+    assert os.listdir(tmp_path / 'running') == [name]
+
+    prepare_sweep_dir(sweep_dir, grid, 5, BOUNDS)
+    assert os.listdir(tmp_path / 'running') == []
+    assert sorted(os.listdir(tmp_path / 'queue')) == [_shard_name(i) for i in range(3)]
+
+
+def test_grid_mismatch_raises(tmp_path):
+    """kito tinklelio katalogo pratęsti negalima"""
+    sweep_dir = str(tmp_path)
+    prepare_sweep_dir(sweep_dir, small_grid(), 5, BOUNDS)
+    with pytest.raises(ValueError):
+        prepare_sweep_dir(sweep_dir, small_grid(), 4, BOUNDS)
+    with pytest.raises(ValueError):
+        prepare_sweep_dir(sweep_dir, small_grid()[:-1], 5, BOUNDS)
+
+
+def test_claim_job_exclusive(tmp_path):
+    """kiekviena dalis atitenka tik vienam gavėjui, net kai ima lygiagrečiai"""
+    sweep_dir = str(tmp_path)
+    grid = build_grid(range(10), [1, 2, 3], [1e-4], ['pusiau', 'auksinis'])
+    prepare_sweep_dir(sweep_dir, grid, 1, BOUNDS)
+
+    def claim_all():
+        names = []
+        while True:
+            name = _claim_job(sweep_dir)
+            if name is None:
+                return names
+            names.append(name)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        claimed = [name for names in pool.map(lambda _: claim_all(), range(8)) for name in names]
+
+    assert len(claimed) == len(grid)
+    assert len(set(claimed)) == len(grid)
+    assert os.listdir(tmp_path / 'queue') == []
+
+
+def test_resume_only_missing_shard(tmp_path):
+    """ištrynus vienos dalies rezultatus, pakartotinai skaičiuojama tik ji"""
+    sweep_dir = str(tmp_path)
+    grid = small_grid()
+    first = run_sweep(sweep_dir, grid, workers=2, shard_size=5, verbose=False)
+
+    results_dir = tmp_path / 'results'
+    mtimes = {name: os.stat(results_dir / name).st_mtime_ns for name in os.listdir(results_dir)}
+    assert sorted(mtimes) == [_shard_name(i) for i in range(3)]
+
+    removed = _shard_name(1)
+    os.remove(results_dir / removed)
+    second = run_sweep(sweep_dir, grid, workers=2, shard_size=5, verbose=False)
+
+    assert sorted(os.listdir(results_dir)) == sorted(mtimes)
+    for name, mtime in mtimes.items():
+        if name != removed:
+            assert os.stat(results_dir / name).st_mtime_ns == mtime
+    assert os.listdir(tmp_path / 'queue') == []
+    assert os.listdir(tmp_path / 'running') == []
+
+    for method in ('pusiau', 'auksinis', 'niutono'):
+        for key in ('n', 'errors', 'iterations', 'func_calls', 'max_err'):
+            assert first.stats[method][key] == second.stats[method][key]
+    assert sum(s['n'] + s['errors'] for s in second.stats.values()) == len(grid)
+
+    with open(results_dir / removed, encoding='utf-8') as fh:
+        assert [row['a'] for row in json.load(fh)] == [c['a'] for c in grid[5:10]]
+
+
+# SUVESTINĖ
+
+def test_aggregator_sums():
+    """SweepAggregator sumuoja sėkmingus sprendimus ir atskirai skaičiuoja klaidas"""
+    rows = [
+        {'a': 4, 'b': 1, 'method': 'pusiau', 'x_min': 2.001, 'iterations': 10, 'func_calls': 31,
+         'time': 0.5, 'error': None},
+        {'a': 4, 'b': 1, 'method': 'pusiau', 'x_min': 1.998, 'iterations': 14, 'func_calls': 43,
+         'time': 1.5, 'error': None},
+        {'a': 0, 'b': 1, 'method': 'niutono', 'x_min': None, 'iterations': None, 'func_calls': None,
+         'time': 0.1, 'error': "f'' ≈ 0"},
+    ]
+    aggregator = SweepAggregator()
+    aggregator.update(rows[:1])
+    aggregator.update(rows[1:])
+
+    s = aggregator.stats['pusiau']
+    assert (s['n'], s['errors'], s['iterations'], s['func_calls']) == (2, 0, 24, 74)
+    assert s['time'] == pytest.approx(2.0)
+    assert s['max_err'] == pytest.approx(0.002)
+    assert aggregator.stats['niutono']['errors'] == 1
+    assert aggregator.stats['niutono']['n'] == 0
+    assert 'Dalijimas pusiau' in aggregator.format_table()
+
+
+def test_auto_rows_kept_separate():
+    """'auto' eilutės nesumaišomos su prašytu metodu, parinktas metodas - 'resolved_method'"""
+    grid = build_grid([0, 4, 6], [1, 7], [1e-12], ['niutono', 'auto'])
+    rows = [run_config(config, **BOUNDS) for config in grid]
+    for config, row in zip(grid, rows):
+        assert row['method'] == config['method']
+        # a = 0, ε = 1e-12: ties x = 0 f''(x) → 0, Niutonas nepavyksta, o 'auto' pereina prie intervalo metodo
+        if config['a'] == 0 and config['method'] == 'niutono':
+            assert row['resolved_method'] == 'niutono'
+            assert row['error'] is not None
+        elif config['a'] == 0:
+            assert row['resolved_method'] == 'auksinis'
+            assert row['error'] is None
+        else:
+            assert row['resolved_method'] == 'niutono'
+            assert row['error'] is None
+
+    aggregator = SweepAggregator()
+    aggregator.update(rows)
+    assert sorted(aggregator.stats) == ['auto', 'niutono']
+    for method in ('auto', 'niutono'):
+        s = aggregator.stats[method]
+        assert s['n'] + s['errors'] == 6
+    assert aggregator.stats['niutono']['errors'] == 2
+    assert aggregator.stats['auto']['errors'] == 0
+    assert 'Automatinis' in aggregator.format_table()
+
+
+def test_reference_minimum_follows_bounds():
+    """paklaida skaičiuojama pagal intervalo [l, r] minimumą, o ne visada √a"""
+    assert reference_minimizers(4, 1, 0, 10) == [2]
+    assert reference_minimizers(4, 1, -10, 0) == [-2]
+    assert reference_minimizers(4, 1, -10, 10) == [-2, 2]
+    # √a už intervalo ribų - minimumas intervalo gale
+    assert reference_minimizers(200, 1, 0, 10) == [10]
+
+    aggregator = SweepAggregator(l=-10, r=0)
+    aggregator.update([{'a': 4, 'b': 1, 'method': 'auksinis', 'x_min': -2.0005, 'iterations': 20,
+                        'func_calls': 22, 'time': 0.0, 'error': None}])
+    assert aggregator.stats['auksinis']['max_err'] == pytest.approx(0.0005)
@@ -0,0 +1,179 @@
+import os
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+
+from optimization_methods import int_dalijimo_pusiau_metodas, auksinio_pjuvio_metodas, niutono_metodas
+from lab_task import create_objective_function, plot_from_trace
+from trace_store import TRACE_DTYPE, HISTORY_FIELDS, TraceWriter, TraceReader, history_to_records, index_path
+
+
+def solve_all(a=6, b=7, epsilon=1e-4):
+    """išsprendžia lab_task uždavinį visais trimis metodais"""
+    f, df, d2f = create_objective_function(a, b)
+    return {
+        'pusiau': int_dalijimo_pusiau_metodas(f, 0, 10, epsilon),
+        'auksinis': auksinio_pjuvio_metodas(f, 0, 10, epsilon),
+        'niutono': niutono_metodas(f, df, d2f, 5, epsilon),
+    }
+
+
+def write_all(path, results):
+    with TraceWriter(str(path)) as writer:
+        return {method: writer.append(method, *res, label=method) for method, res in results.items()}
+
+
+# ĮRAŠAI
+
+def test_history_to_records_round_trip():
+    """kiekvieno metodo istorijos reikšmės išlieka tos pačios, nenaudojami laukai - NaN"""
+    for method, res in solve_all().items():
+        history = res[4]
+        records = history_to_records(history)
+        assert records.dtype == TRACE_DTYPE
+        assert len(records) == len(history)
+        for key, name in HISTORY_FIELDS.items():
+            if key in history[0]:
+                assert list(records[name]) == [h[key] for h in history], (method, key)
+            elif TRACE_DTYPE[name].kind == 'f':
+                assert np.isnan(records[name]).all(), (method, name)
+            else:
+                assert (records[name] == -1).all(), (method, name)
+
+    assert len(history_to_records([])) == 0
+
+
+def test_trajectory_is_memmap_view(tmp_path):
+    """trajectory() grąžina atvaizduoto failo vaizdą, o ne kopiją"""
+    path = tmp_path / 'trasos.npy'
+    results = solve_all()
+    ids = write_all(path, results)
+
+    reader = TraceReader(str(path))
+    assert len(reader) == 3
+    for method, solve_id in ids.items():
+        traj = reader.trajectory(solve_id)
+        assert isinstance(traj, np.memmap)
+        assert np.shares_memory(traj, reader.records)
+        assert len(traj) == len(results[method][4])
+        assert reader.result(solve_id) == tuple(results[method][:4])
+    assert list(reader.solves(method='auksinis')) == [ids['auksinis']]
+
+
+def test_trial_points_match_lab_task(tmp_path):
+    """trial_points() sutampa su lab_task.main renkamais bandymo taškais"""
+    path = tmp_path / 'trasos.npy'
+    results = solve_all()
+    ids = write_all(path, results)
+    reader = TraceReader(str(path))
+
+    points_bis = []
+    for h in results['pusiau'][4]:
+        points_bis.extend([h['l'], h['x_1'], h['x_m'], h['x_2'], h['r']])
+
+    points_gold = []
+    for h in results['auksinis'][4]:
+        points_gold.extend([h['l'], h['x_1'], h['x_2'], h['r']])
+
+    points_newton = [h['x_i'] for h in results['niutono'][4]]
+    for h in results['niutono'][4]:
+        if 'x_next' in h:
+            points_newton.append(h['x_next'])
+
+    assert list(reader.trial_points(ids['pusiau'])) == points_bis
+    assert list(reader.trial_points(ids['auksinis'])) == points_gold
+    assert list(reader.trial_points(ids['niutono'])) == points_newton
+
+
+def test_plot_from_trace(tmp_path, monkeypatch):
+    """vizualizacija braižoma tiesiai iš atvaizduoto failo į nurodytą vietą"""
+    path = str(tmp_path / 'trasos.npy')
+    results = {'a=6': solve_all(6, 7), 'a=4': solve_all(4, 3)}
+    with TraceWriter(path) as writer:
+        ids = {
+            label: {method: writer.append(method, *res, label=label) for method, res in solves.items()}
+            for label, solves in results.items()
+        }
+
+    # darbiniame kataloge niekas neturi būti įrašyta
+    workdir = tmp_path / 'cwd'
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    written = []
+    for label, (a, b) in (('a=6', (6, 7)), ('a=4', (4, 3))):
+        f, _, _ = create_objective_function(a, b)
+        prefix = str(tmp_path / 'viz_{}'.format(label))
+        paths = plot_from_trace(f, path, ids[label]['pusiau'], ids[label]['auksinis'], ids[label]['niutono'],
+                                output_prefix=prefix)
+        assert paths == (prefix + '.png', prefix + '_arti.png')
+        written.extend(paths)
+
+    assert len(set(written)) == 4
+    for png in written:
+        with open(png, 'rb') as fh:
+            assert fh.read(8) == b'\x89PNG\r\n\x1a\n'
+    assert os.listdir(workdir) == []
+
+
+# PRATĘSIMAS
+
+def test_append_mode_resumes(tmp_path):
+    """mode='a' prirašo prie esamo failo, išsaugodamas ankstesnius sprendimus"""
+    path = str(tmp_path / 'trasos.npy')
+    results = solve_all()
+    with TraceWriter(path) as writer:
+        writer.append('pusiau', *results['pusiau'])
+    with TraceWriter(path, mode='a') as writer:
+        assert writer.append('niutono', *results['niutono']) == 1
+
+    reader = TraceReader(path)
+    assert list(reader.index['method']) == ['pusiau', 'niutono']
+    assert len(reader.records) == len(results['pusiau'][4]) + len(results['niutono'][4])
+    assert list(reader.trajectory(1)['x_i']) == [h['x_i'] for h in results['niutono'][4]]
+
+
+def test_append_mode_drops_unindexed_records(tmp_path):
+    """po nutrūkimo tarp antraštės ir indekso įrašymo pratęsiama nuo indekso pabaigos"""
+    path = str(tmp_path / 'trasos.npy')
+    results = solve_all()
+    with TraceWriter(path) as writer:
+        writer.append('pusiau', *results['pusiau'])
+    saved_index = np.load(index_path(path))
+
+    # antraštė ir įrašai atnaujinti, bet indeksas - ne
+    with TraceWriter(path, mode='a') as writer:
+        writer.append('auksinis', *results['auksinis'])
+    np.save(index_path(path), saved_index)
+
+    with TraceWriter(path, mode='a') as writer:
+        assert writer.append('niutono', *results['niutono']) == 1
+
+    reader = TraceReader(path)
+    n_bis = len(results['pusiau'][4])
+    assert len(reader.records) == n_bis + len(results['niutono'][4])
+    assert reader.index['start'][1] == n_bis
+    assert list(reader.trajectory(1)['x_i']) == [h['x_i'] for h in results['niutono'][4]]
+
+
+def test_append_mode_without_index(tmp_path):
+    """be indekso failo pratęsti negalima"""
+    path = str(tmp_path / 'trasos.npy')
+    write_all(path, solve_all())
+    (tmp_path / 'trasos.index.npy').unlink()
+    with pytest.raises(FileNotFoundError, match='indekso'):
+        TraceWriter(path, mode='a')
+
+
+def test_long_strings_rejected(tmp_path):
+    """per ilgi metodo pavadinimai ir žymės neturi būti tyliai nupjaunami"""
+    res = solve_all()['pusiau']
+    with TraceWriter(str(tmp_path / 'trasos.npy')) as writer:
+        with pytest.raises(ValueError):
+            writer.append('pusiau', *res, label='x' * 100)
+        with pytest.raises(ValueError):
+            writer.append('labai_ilgas_metodo_pavadinimas', *res)
+        assert writer.append('pusiau', *res, label='x' * 64) == 0
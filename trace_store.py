@@ -0,0 +1,256 @@
+"""
+Sprendimu istoriju saugykla atmintyje atvaizduojamame (memory-mapped) faile.
+
+Visu triju metodu iteraciju irasai rasomi i viena tipizuota .npy faila
+(TRACE_DTYPE), o salia esantis indekso failas (<vardas>.index.npy) saugo
+kiekvieno sprendimo pradzia, irasu skaiciu ir galutinius rezultatus.
+Skaitant failas atvaizduojamas su np.load(mmap_mode='r'), todel bet kurio
+sprendimo trajektorija grazinama kaip vaizdas (view) be kopijavimo.
+
+Pavyzdys:
+    with TraceWriter('trasos.npy') as writer:
+        writer.append('pusiau', *int_dalijimo_pusiau_metodas(f, 0, 10), label='a=6,b=7')
+
+    reader = TraceReader('trasos.npy')
+    traj = reader.trajectory(0)
+    traj['x_m']
+"""
+
+import os
+import struct
+from typing import List, Optional
+
+import numpy as np
+
+
+# istorijos rakto -> TRACE_DTYPE lauko atitikmenys
+HISTORY_FIELDS = {
+    'iteration': 'iteration',
+    'func_calls': 'func_calls',
+    'l': 'l',
+    'r': 'r',
+    'L': 'L',
+    'x_m': 'x_m',
+    'x_1': 'x_1',
+    'x_2': 'x_2',
+    'f(x_m)': 'f_xm',
+    'f(x_1)': 'f_x1',
+    'f(x_2)': 'f_x2',
+    'x_i': 'x_i',
+    'x_next': 'x_next',
+    'step': 'step',
+    "f'(x_i)": 'df',
+    "f''(x_i)": 'd2f',
+}
+
+# vienas iteracijos irasas; metodui nereikalingi laukai lieka NaN (sveikieji -1)
+TRACE_DTYPE = np.dtype(
+    [('iteration', '<i8'), ('func_calls', '<i8')]
+    + [(name, '<f8') for name in HISTORY_FIELDS.values() if name not in ('iteration', 'func_calls')]
+)
+
+INDEX_DTYPE = np.dtype([
+    ('method', '<U16'),
+    ('label', '<U64'),
+    ('start', '<i8'),
+    ('count', '<i8'),
+    ('x_min', '<f8'),
+    ('f_min', '<f8'),
+    ('iterations', '<i8'),
+    ('func_calls', '<i8'),
+])
+
+# fiksuoto ilgio .npy antraste, kad irasu skaiciu butu galima atnaujinti vietoje
+_HEADER_LEN = 1024
+
+
+def index_path(path: str) -> str:
+    """grąžina indekso failo kelią duomenų failui"""
+    base, _ = os.path.splitext(path)
+    return base + '.index.npy'
+
+
+def history_to_records(history: list) -> np.ndarray:
+    """
+    paverčia metodo istoriją (žodynų sąrašą) į TRACE_DTYPE masyvą.
+
+    parametrai:
+        history: bet kurio iš trijų metodų grąžinta istorija
+    grąžina:
+        struktūrinis masyvas, po vieną įrašą kiekvienai iteracijai
+    """
+    records = np.empty(len(history), dtype=TRACE_DTYPE)
+    for name in TRACE_DTYPE.names:
+        records[name] = -1 if TRACE_DTYPE[name].kind == 'i' else np.nan
+    if not history:
+        return records
+
+    for key, name in HISTORY_FIELDS.items():
+        if key in history[0]:
+            records[name] = [h[key] for h in history]
+    return records
+
+
+def _write_header(fh, count: int):
+    header = repr({
+        'descr': np.lib.format.dtype_to_descr(TRACE_DTYPE),
+        'fortran_order': False,
+        'shape': (count,),
+    }).encode('latin1')
+    body_len = _HEADER_LEN - 10
+    if len(header) + 1 > body_len:
+        raise ValueError("Per ilga .npy antraštė")
+    fh.seek(0)
+    fh.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', body_len) + header.ljust(body_len - 1) + b'\n')
+
+
+class TraceWriter:
+    """
+    prirašo sprendimų istorijas į tipizuotą .npy failą.
+
+    Įrašai rašomi į failo galą, o antraštė ir indeksas atnaujinami per
+    flush() ir close(), todėl neuždarytas failas skaitomas iki paskutinio flush().
+
+    parametrai:
+        path: duomenų failo kelias (.npy)
+        mode: 'w' - naujas failas, 'a' - pratęsti esamą
+    """
+
+    def __init__(self, path: str, mode: str = 'w'):
+        if mode not in ('w', 'a'):
+            raise ValueError("mode turi būti 'w' arba 'a'")
+        self.path = path
+        self._index: List[tuple] = []
+        self._count = 0
+
+        if mode == 'a' and os.path.exists(path):
+            if not os.path.exists(index_path(path)):
+                raise FileNotFoundError(
+                    "Failas {} neturi indekso {}, pratęsti negalima".format(path, index_path(path))
+                )
+            existing = np.load(path, mmap_mode='r')
+            if existing.dtype != TRACE_DTYPE:
+                raise ValueError("Failo {} įrašų tipas nesutampa su TRACE_DTYPE".format(path))
+            n_records = len(existing)
+            del existing
+            index = np.load(index_path(path))
+            self._index = [tuple(row) for row in index]
+            # pratęsiama nuo indekse aprašytų įrašų pabaigos: antraštė įrašoma prieš
+            # indeksą, todėl po nutrūkimo joje gali būti įrašų, kurių indeksas neapima
+            self._count = int((index['start'] + index['count']).max()) if len(index) else 0
+            if self._count > n_records:
+                raise ValueError("Failo {} indeksas nurodo daugiau įrašų nei yra faile".format(path))
+            self._fh = open(path, 'r+b')
+            self._fh.seek(_HEADER_LEN + self._count * TRACE_DTYPE.itemsize)
+            self._fh.truncate()
+            _write_header(self._fh, self._count)
+            self._fh.seek(0, os.SEEK_END)
+        else:
+            self._fh = open(path, 'w+b')
+            _write_header(self._fh, 0)
+
+    def append(
+        self,
+        method: str,
+        x_min: float,
+        f_min: float,
+        iterations: int,
+        func_calls: int,
+        history: list,
+        label: str = ''
+    ) -> int:
+        """
+        prirašo vieno sprendimo istoriją. Argumentų tvarka sutampa su metodų
+        grąžinamu rezultatu, todėl galima rašyti writer.append('pusiau', *rezultatas).
+
+        grąžina:
+            sprendimo numeris (solve_id)
+        """
+        for field, value in (('method', method), ('label', label)):
+            max_len = INDEX_DTYPE[field].itemsize // 4
+            if len(value) > max_len:
+                raise ValueError("{} ilgesnis nei {} simbolių: {!r}".format(field, max_len, value))
+        records = history_to_records(history)
+        self._fh.write(records.tobytes())
+        self._index.append((method, label, self._count, len(records),
+                            x_min, f_min, iterations, func_calls))
+        self._count += len(records)
+        return len(self._index) - 1
+
+    def flush(self):
+        """atnaujina antraštę ir indeksą, kad failą būtų galima skaityti"""
+        end = self._fh.tell()
+        _write_header(self._fh, self._count)
+        self._fh.seek(end)
+        self._fh.flush()
+
+        tmp_path = index_path(self.path) + '.tmp'
+        with open(tmp_path, 'wb') as fh:
+            np.save(fh, np.array(self._index, dtype=INDEX_DTYPE))
+        os.replace(tmp_path, index_path(self.path))
+
+    def close(self):
+        if self._fh.closed:
+            return
+        self.flush()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class TraceReader:
+    """
+    skaito TraceWriter sukurtą failą per atminties atvaizdavimą.
+
+    parametrai:
+        path: duomenų failo kelias (.npy)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = np.load(path, mmap_mode='r')
+        self.index = np.load(index_path(path))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def solves(self, method: Optional[str] = None, label: Optional[str] = None) -> np.ndarray:
+        """grąžina sprendimų numerius, atrinktus pagal metodą ir (ar) žymę"""
+        mask = np.ones(len(self.index), dtype=bool)
+        if method is not None:
+            mask &= self.index['method'] == method
+        if label is not None:
+            mask &= self.index['label'] == label
+        return np.flatnonzero(mask)
+
+    def trajectory(self, solve_id: int) -> np.ndarray:
+        """grąžina sprendimo iteracijų įrašus kaip vaizdą į atvaizduotą failą (be kopijavimo)"""
+        entry = self.index[solve_id]
+        return self.records[entry['start']:entry['start'] + entry['count']]
+
+    def result(self, solve_id: int) -> tuple:
+        """grąžina (x_min, f_min, iterations, func_calls)"""
+        entry = self.index[solve_id]
+        return float(entry['x_min']), float(entry['f_min']), int(entry['iterations']), int(entry['func_calls'])
+
+    def trial_points(self, solve_id: int) -> np.ndarray:
+        """
+        grąžina metodo bandymo taškus ta pačia tvarka, kaip juos renka lab_task vizualizacija.
+
+        dalijimas pusiau: l, x_1, x_m, x_2, r kiekvienai iteracijai
+        auksinis pjūvis: l, x_1, x_2, r kiekvienai iteracijai
+        Niutono metodas: visi x_i, po jų visi x_next
+        """
+        traj = self.trajectory(solve_id)
+        method = self.index[solve_id]['method']
+        if method == 'pusiau':
+            return np.column_stack([traj['l'], traj['x_1'], traj['x_m'], traj['x_2'], traj['r']]).ravel()
+        if method == 'auksinis':
+            return np.column_stack([traj['l'], traj['x_1'], traj['x_2'], traj['r']]).ravel()
+        if method == 'niutono':
+            return np.concatenate([traj['x_i'], traj['x_next']])
+        raise ValueError("Nežinomas metodas: {}".format(method))